@@ -7,13 +7,24 @@ Python API directly for better performance and tighter integration.
 """
 
 import asyncio
+import atexit
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+import multiprocessing
+import os
+import re
+import struct
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
 
+import anyio
 import httpx
-from pydantic import BaseModel, Field, field_validator, model_validator
-from trafilatura import extract, fetch_url
+from charset_normalizer import from_bytes
+from lxml.etree import XPath
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from modelcontextprotocol.server import Server
 from modelcontextprotocol.transport.stdio import stdio_transport
@@ -26,14 +37,84 @@ from modelcontextprotocol.types import (
     Tool,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    import lxml.html
+    from trafilatura.settings import Extractor
+
+# Configure logging; defaults to WARNING so per-request INFO messages cost
+# nothing unless enabled via TRAFILATURA_MCP_LOG (e.g. TRAFILATURA_MCP_LOG=INFO)
+_LOG_LEVEL_NAME = os.environ.get("TRAFILATURA_MCP_LOG", "WARNING").upper()
+_log_level = logging.getLevelName(_LOG_LEVEL_NAME)  # Unknown names come back as str
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.WARNING)
 logger = logging.getLogger(__name__)
+if not isinstance(_log_level, int):
+    logger.warning(
+        "Unknown TRAFILATURA_MCP_LOG level %r; using WARNING", _LOG_LEVEL_NAME
+    )
+
+# http(s) URL with a non-empty host; cheaper than urlparse for this check
+_URL_RE = re.compile(
+    r"https?://"
+    r"(?:[^\s/?#@]*@)?"  # Optional userinfo
+    r"(?:\[[0-9a-f:.]+\]|[^\s/?#@:\[\]]+)"  # Host, or bracketed IPv6 literal
+    r"(?::\d*)?"  # Optional port
+    r"(?:[/?#].*)?\Z",
+    re.IGNORECASE,
+)
+
+# Bounded LRU of extracted results, keyed by a digest of (html, options)
+_RESULT_CACHE_MAX = 128
+_result_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+# Extractions currently running, by the same key, so concurrent identical
+# requests share one extraction instead of each paying for it
+_inflight: "Dict[bytes, asyncio.Task[str]]" = {}
+
+# Trafilatura extraction is CPU-bound and holds the GIL, so it runs in a
+# dedicated process pool rather than the loop's default thread pool. The pool
+# is created lazily, so worker processes importing this module don't build
+# pools of their own.
+_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+_extract_pool: Optional[ProcessPoolExecutor] = None
+
+# Bound in-flight work so bursts queue here instead of piling large payloads
+# into the pool. Fetching is I/O bound and gets a much wider limit.
+_EXTRACT_LIMITER = anyio.CapacityLimiter(_EXTRACT_WORKERS)
+_FETCH_LIMITER = anyio.CapacityLimiter(64)
+
+# Elements never part of plain-text output, removed up front for "txt" in
+# precision mode so Trafilatura's own cleaning has less of the tree to walk.
+# JSON-LD scripts are kept: Trafilatura can recover the article body from them.
+_BOILERPLATE_XPATH = XPath(
+    "//script[not(@type='application/ld+json')]"
+    "|//style|//noscript|//nav|//footer|//aside"
+)
+
+# Shared HTTP client, created lazily and reused for connection pooling. Its
+# connections belong to the event loop it was created in, so that loop is
+# tracked alongside it, as is the task that closes it (held here because the
+# loop only keeps weak references to tasks).
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_client_closer: "Optional[asyncio.Task[None]]" = None
+
+# Response bodies are truncated past this size; the main content of a page is
+# virtually always within the first few megabytes of HTML
+_MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+_CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# (output_format, precision, include_comments, include_tables, include_images,
+#  include_links)
+ExtractOptions = Tuple[str, bool, bool, bool, bool, bool]
 
 
 class ExtractMarkdownInput(BaseModel):
     """Input model for the extract_markdown tool."""
     
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     # Primary input (exactly one required)
     url: Optional[str] = Field(
         default=None,
@@ -75,7 +156,7 @@ class ExtractMarkdownInput(BaseModel):
     )
     
     # Output format options
-    output_format: str = Field(
+    output_format: Literal["markdown", "txt", "xml"] = Field(
         default="markdown",
         description="Output format: 'markdown', 'txt', or 'xml'"
     )
@@ -83,42 +164,161 @@ class ExtractMarkdownInput(BaseModel):
     @field_validator("url")
     @classmethod
     def validate_url(cls, v: Optional[str]) -> Optional[str]:
-        """Validate URL format if provided."""
-        if v is None:
-            return v
+        """
+        Validate URL format if provided.
         
-        try:
-            result = urlparse(v)
-            if not result.scheme or not result.netloc:
-                raise ValueError("URL must include scheme and netloc (e.g., https://example.com)")
-            if result.scheme not in ("http", "https"):
-                raise ValueError("URL scheme must be http or https")
-            return v
-        except Exception as e:
-            raise ValueError(f"Invalid URL format: {e}")
-
-    @field_validator("output_format")
-    @classmethod
-    def validate_output_format(cls, v: str) -> str:
-        """Validate output format."""
-        valid_formats = {"markdown", "txt", "xml"}
-        if v not in valid_formats:
-            raise ValueError(f"Output format must be one of: {', '.join(valid_formats)}")
+        Pydantic runs this on every model construction, so it is kept to a
+        single precompiled regex match.
+        """
+        if v is not None and not _URL_RE.match(v):
+            raise ValueError(
+                "Invalid URL format: URL must use http or https and include a host "
+                "(e.g., https://example.com)"
+            )
         return v
 
     @model_validator(mode="after")
     def validate_input_source(self) -> "ExtractMarkdownInput":
         """Ensure exactly one of url or html is provided."""
-        url_provided = self.url is not None
-        html_provided = self.html is not None and self.html.strip()
+        html = self.html
+        html_provided = html is not None and html != "" and not html.isspace()
         
-        if url_provided == html_provided:  # Both true or both false
+        if (self.url is not None) == html_provided:  # Both true or both false
             raise ValueError("Provide exactly one of 'url' or 'html'")
         
         return self
 
 
-async def fetch_url_async(url: str, timeout: int = 30) -> Optional[str]:
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the extraction process pool, creating it on first use."""
+    global _extract_pool
+    if _extract_pool is None:
+        # By now the process has threads (stdio transport, getaddrinfo), so
+        # forking it could deadlock the children; start workers from a clean
+        # forkserver process instead, or spawn them where that is unavailable
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        _extract_pool = ProcessPoolExecutor(
+            max_workers=_EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context(start_method),
+        )
+    return _extract_pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next extraction starts a fresh one."""
+    global _extract_pool
+    if _extract_pool is pool:  # Another request may already have replaced it
+        _extract_pool = None
+    pool.shutdown(wait=False)
+
+
+@atexit.register
+def _shutdown_pool() -> None:
+    """Shut down the extraction process pool if it was created."""
+    if _extract_pool is not None:
+        _extract_pool.shutdown()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client for the running event loop.
+
+    Reusing one client keeps connections (and TLS sessions) alive across
+    fetches and lets concurrent requests to the same host share an HTTP/2
+    connection. A client left over from another (typically closed) event loop
+    cannot be used, so a new one is created whenever the loop changes.
+    """
+    global _client, _client_loop, _client_closer
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+            timeout=None,
+            headers={
+                "User-Agent": "Mozilla/5.0 (compatible; Trafilatura-MCP/0.1.0)"
+            }
+        )
+        _client_loop = loop
+        _client_closer = loop.create_task(_close_client_on_cancel(_client))
+    return _client
+
+
+async def _close_client_on_cancel(client: httpx.AsyncClient) -> None:
+    """
+    Keep ``client`` open until this task is cancelled, then close it.
+
+    asyncio.run() cancels leftover tasks before closing its loop, so the client
+    is closed inside the loop that owns its connections.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await client.aclose()
+
+
+def _complete_utf8_length(body: Union[bytes, bytearray]) -> int:
+    """
+    Length of ``body`` without a trailing incomplete UTF-8 sequence.
+
+    Used to trim a truncated body back to a character boundary. Without this,
+    a body cut mid-character no longer decodes as UTF-8 and gets handed to
+    charset detection, which then misreads the whole document.
+    """
+    end = len(body)
+    lead = end - 1
+    # Walk back over (at most three) continuation bytes to the lead byte
+    while lead >= 0 and end - lead <= 3 and body[lead] & 0xC0 == 0x80:
+        lead -= 1
+    if lead < 0:
+        return end
+    
+    first = body[lead]
+    if first & 0xE0 == 0xC0:
+        expected = 2
+    elif first & 0xF0 == 0xE0:
+        expected = 3
+    elif first & 0xF8 == 0xF0:
+        expected = 4
+    else:
+        return end  # ASCII or not UTF-8 at all; nothing to trim
+    return lead if end - lead < expected else end
+
+
+def _body_to_utf8(body: bytes, content_type: str) -> bytes:
+    """
+    Normalize a response body to UTF-8 bytes, avoiding work whenever possible.
+
+    UTF-8 (declared, or undeclared but valid) and pure ASCII bodies are returned
+    untouched; a declared charset is honoured; only undeclared non-UTF-8 bodies
+    fall back to charset detection.
+    """
+    match = _CHARSET_RE.search(content_type)
+    charset = match.group(1).lower() if match else None
+    
+    if charset in ("utf-8", "utf8") or (charset is None and body.isascii()):
+        return body
+    
+    if charset is not None:
+        try:
+            return body.decode(charset, "replace").encode("utf-8")
+        except LookupError:
+            pass  # Unknown charset label; detect instead
+    
+    try:
+        body.decode("utf-8")
+        return body
+    except UnicodeDecodeError:
+        best = from_bytes(body).best()
+        return best.output("utf-8") if best is not None else body
+
+
+async def fetch_url_async(url: str, timeout: int = 30) -> Optional[bytes]:
     """
     Fetch URL content asynchronously with proper error handling.
     
@@ -127,35 +327,138 @@ async def fetch_url_async(url: str, timeout: int = 30) -> Optional[str]:
         timeout: Request timeout in seconds
         
     Returns:
-        HTML content as string, or None if fetch failed
+        HTML content as UTF-8 encoded bytes, or None if fetch failed
     """
     try:
-        async with httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; Trafilatura-MCP/0.1.0)"
-            }
-        ) as client:
-            response = await client.get(url)
+        async with _FETCH_LIMITER, _get_client().stream(
+            "GET", url, timeout=timeout
+        ) as response:
             response.raise_for_status()
-            return response.text
+            
+            # Reject non-HTML payloads before downloading them; leaving the
+            # stream context closes the response without draining the body.
+            # A missing Content-Type is given the benefit of the doubt.
+            content_type = response.headers.get("content-type", "")
+            media_type = content_type.split(";", 1)[0].strip().lower()
+            if media_type and media_type not in _HTML_CONTENT_TYPES:
+                raise McpError(
+                    ErrorCode.INVALID_PARAMS,
+                    f"Unsupported content-type: {media_type}"
+                )
+            
+            body = bytearray()
+            async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) > _MAX_RESPONSE_BYTES:
+                    logger.warning(
+                        "Response from %s exceeds %d bytes; truncating",
+                        url,
+                        _MAX_RESPONSE_BYTES,
+                    )
+                    del body[_MAX_RESPONSE_BYTES:]
+                    del body[_complete_utf8_length(body):]
+                    break
+        return _body_to_utf8(bytes(body), content_type)
+    except McpError:
+        raise
     except httpx.TimeoutException:
-        logger.error(f"Timeout fetching URL: {url}")
+        logger.error("Timeout fetching URL: %s", url)
         raise McpError(ErrorCode.INTERNAL_ERROR, f"Timeout fetching URL: {url}")
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error fetching URL {url}: {e.response.status_code}")
+        logger.error("HTTP error fetching URL %s: %s", url, e.response.status_code)
         raise McpError(
             ErrorCode.INTERNAL_ERROR,
             f"HTTP {e.response.status_code} error fetching URL: {url}"
         )
     except Exception as e:
-        logger.error(f"Error fetching URL {url}: {e}")
+        logger.error("Error fetching URL %s: %s", url, e)
         raise McpError(ErrorCode.INTERNAL_ERROR, f"Error fetching URL: {e}")
 
 
+@lru_cache(maxsize=32)
+def _get_options(
+    output_format: str,
+    precision: bool,
+    include_comments: bool,
+    include_tables: bool,
+    include_images: bool,
+    include_links: bool,
+) -> "Extractor":
+    """
+    Build (and cache) the Trafilatura extractor configuration for a set of options.
+
+    Passing a prebuilt ``Extractor`` via ``options=`` spares Trafilatura from
+    re-parsing keyword arguments and allocating a fresh config on every call.
+    """
+    from trafilatura.settings import Extractor
+
+    return Extractor(
+        output_format=output_format,
+        recall=not precision,
+        comments=include_comments,
+        tables=include_tables,
+        images=include_images,
+        links=include_links,
+    )
+
+
+def _result_cache_key(html: bytes, input_data: "ExtractMarkdownInput") -> bytes:
+    """
+    Compute the result cache key for an HTML payload and its extraction options.
+
+    The options are packed into the BLAKE2b key so that identical HTML extracted
+    with different settings never collides.
+    """
+    options_key = struct.pack(
+        "?????",
+        input_data.precision,
+        input_data.include_comments,
+        input_data.include_tables,
+        input_data.include_images,
+        input_data.include_links,
+    ) + input_data.output_format.encode("ascii")
+    return hashlib.blake2b(html, digest_size=16, key=options_key).digest()
+
+
+def _parse_html(html: Union[bytes, str]) -> "Optional[lxml.html.HtmlElement]":
+    """
+    Parse HTML into an lxml tree, or return None if it is not usable HTML.
+
+    Uses Trafilatura's own loader so that its dubious-input rejection, markup
+    repair and parser fallbacks apply exactly as if ``extract`` parsed the raw
+    document itself.
+    """
+    from trafilatura.utils import load_html
+
+    if isinstance(html, bytes):
+        # Documents arrive already normalized to UTF-8; decode them here so
+        # Trafilatura doesn't re-detect the encoding, which a leftover
+        # <meta charset> from the original page could send astray
+        html = html.decode("utf-8", "replace")
+    return load_html(html)
+
+
+def _extract(html: Union[bytes, str], options: ExtractOptions) -> Optional[str]:
+    """Run Trafilatura extraction; executed inside an extraction pool worker."""
+    # Imported lazily so the server process itself never loads Trafilatura;
+    # only pool workers pay for it, on their first extraction
+    from trafilatura.core import extract
+
+    tree = _parse_html(html)
+    if tree is None:
+        return None  # What extract() returns for input its loader rejects
+    # In recall mode Trafilatura may fall back to content in these elements
+    # (e.g. an article inside <aside>), so the tree is left intact there
+    output_format, precision = options[0], options[1]
+    if output_format == "txt" and precision:
+        for element in _BOILERPLATE_XPATH(tree):
+            if element.getparent() is not None:
+                element.drop_tree()  # Keeps the element's tail text
+    return extract(tree, options=_get_options(*options))
+
+
 async def extract_content_async(
-    html: str,
+    html: Union[bytes, str],
     output_format: str = "markdown",
     precision: bool = True,
     include_comments: bool = False,
@@ -164,10 +467,10 @@ async def extract_content_async(
     include_links: bool = True,
 ) -> Optional[str]:
     """
-    Extract content from HTML using Trafilatura in a thread pool.
+    Extract content from HTML using Trafilatura in the extraction process pool.
     
     Args:
-        html: HTML content to extract from
+        html: HTML content to extract from (preferably UTF-8 encoded bytes)
         output_format: Output format ('markdown', 'txt', or 'xml')
         precision: Favor precision over recall
         include_comments: Include HTML comments
@@ -178,27 +481,79 @@ async def extract_content_async(
     Returns:
         Extracted content as string, or None if extraction failed
     """
-    def _extract():
-        return extract(
-            html,
-            output_format=output_format,
-            favor_recall=not precision,
-            include_comments=include_comments,
-            include_tables=include_tables,
-            include_images=include_images,
-            include_links=include_links,
-        )
+    options: ExtractOptions = (
+        output_format,
+        precision,
+        include_comments,
+        include_tables,
+        include_images,
+        include_links,
+    )
     
+    pool = _get_pool()
     try:
-        # Run extraction in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, _extract)
+        # Run extraction in the process pool to avoid blocking
+        loop = asyncio.get_running_loop()
+        async with _EXTRACT_LIMITER:
+            result = await loop.run_in_executor(pool, _extract, html, options)
         return result
+    except BrokenProcessPool as e:
+        # A worker died (e.g. OOM-killed on a pathological page), which leaves
+        # the whole pool unusable. Replace it and fail only this request;
+        # retrying would likely kill the next worker the same way.
+        logger.error("Extraction worker terminated abruptly: %s", e)
+        _discard_pool(pool)
+        raise McpError(
+            ErrorCode.INTERNAL_ERROR,
+            "Content extraction failed: extraction worker terminated abruptly"
+        )
     except Exception as e:
-        logger.error(f"Error during content extraction: {e}")
+        logger.error("Error during content extraction: %s", e)
         raise McpError(ErrorCode.INTERNAL_ERROR, f"Content extraction failed: {e}")
 
 
+async def _extract_text(html: bytes, input_data: ExtractMarkdownInput) -> str:
+    """
+    Extract and strip content from HTML according to the validated input options.
+    
+    Raises:
+        McpError: If extraction fails or yields no content
+    """
+    logger.info("Extracting content using Trafilatura API")
+    extracted_content = await extract_content_async(
+        html,
+        output_format=input_data.output_format,
+        precision=input_data.precision,
+        include_comments=input_data.include_comments,
+        include_tables=input_data.include_tables,
+        include_images=input_data.include_images,
+        include_links=input_data.include_links,
+    )
+    
+    text = extracted_content.strip() if extracted_content else ""
+    if not text:
+        raise McpError(
+            ErrorCode.INTERNAL_ERROR,
+            "Trafilatura returned empty content. The page may not contain extractable text."
+        )
+    
+    logger.info("Successfully extracted %d characters", len(text))
+    return text
+
+
+def _finish_extraction(cache_key: bytes, task: "asyncio.Task[str]") -> None:
+    """Retire a finished shared extraction, caching its result on success."""
+    _inflight.pop(cache_key, None)
+    if task.cancelled():
+        return
+    # Retrieving the exception also keeps asyncio from logging it as never
+    # retrieved when every caller has gone away
+    if task.exception() is None:
+        _result_cache[cache_key] = task.result()
+        if len(_result_cache) > _RESULT_CACHE_MAX:
+            _result_cache.popitem(last=False)
+
+
 async def extract_markdown_tool(args: Dict[str, Any]) -> List[TextContent]:
     """
     Extract main article content and return as markdown using Trafilatura API.
@@ -217,46 +572,54 @@ async def extract_markdown_tool(args: Dict[str, Any]) -> List[TextContent]:
         try:
             input_data = ExtractMarkdownInput(**args)
         except Exception as e:
-            logger.error(f"Input validation failed: {e}")
+            logger.error("Input validation failed: %s", e)
             raise McpError(ErrorCode.INVALID_PARAMS, f"Invalid parameters: {e}")
         
         # Get HTML content
-        html_content: Optional[str] = None
+        html_content: Optional[bytes] = None
         
         if input_data.url:
-            logger.info(f"Fetching content from URL: {input_data.url}")
+            logger.info("Fetching content from URL: %s", input_data.url)
             html_content = await fetch_url_async(input_data.url, input_data.timeout)
-        else:
-            html_content = input_data.html
+        elif input_data.html is not None:
+            # Encode once: the bytes are hashed directly and cross into the
+            # extraction workers without another encode/decode round trip
+            html_content = input_data.html.encode("utf-8", "replace")
         
-        if not html_content or not html_content.strip():
+        # isspace() stops at the first non-whitespace character instead of
+        # copying the whole document like strip() would
+        if not html_content or html_content.isspace():
             raise McpError(ErrorCode.INTERNAL_ERROR, "No HTML content available for extraction")
         
-        # Extract content using Trafilatura
-        logger.info("Extracting content using Trafilatura API")
-        extracted_content = await extract_content_async(
-            html_content,
-            output_format=input_data.output_format,
-            precision=input_data.precision,
-            include_comments=input_data.include_comments,
-            include_tables=input_data.include_tables,
-            include_images=input_data.include_images,
-            include_links=input_data.include_links,
-        )
+        # Serve repeated payloads (client retries, re-renders) from the cache.
+        # Cache access happens on the event loop without awaiting, so it needs
+        # no extra locking.
+        cache_key = _result_cache_key(html_content, input_data)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            _result_cache.move_to_end(cache_key)
+            logger.info("Serving extracted content from cache")
+            return [TextContent(type="text", text=cached)]
         
-        if not extracted_content or not extracted_content.strip():
-            raise McpError(
-                ErrorCode.INTERNAL_ERROR,
-                "Trafilatura returned empty content. The page may not contain extractable text."
-            )
+        # Join an identical extraction that is already running, or start one.
+        # The extraction runs as its own task and every caller (including the
+        # one that started it) awaits it through a shield, so cancelling any
+        # caller never cancels the shared work.
+        task = _inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(_extract_text(html_content, input_data))
+            _inflight[cache_key] = task
+            task.add_done_callback(partial(_finish_extraction, cache_key))
+        else:
+            logger.info("Awaiting identical in-flight extraction")
         
-        logger.info(f"Successfully extracted {len(extracted_content)} characters")
-        return [TextContent(type="text", text=extracted_content.strip())]
+        text = await asyncio.shield(task)
+        return [TextContent(type="text", text=text)]
         
     except McpError:
         raise  # Re-raise MCP errors as-is
     except Exception as e:
-        logger.error(f"Unexpected error in extract_markdown_tool: {e}")
+        logger.error("Unexpected error in extract_markdown_tool: %s", e)
         raise McpError(ErrorCode.INTERNAL_ERROR, f"Unexpected error: {e}")
 
 
@@ -264,76 +627,94 @@ async def extract_markdown_tool(args: Dict[str, Any]) -> List[TextContent]:
 server = Server(name="mcp-web-extractor", version="0.1.0")
 
 
+# Tool definition and input schema, built once at import time instead of on
+# every list_tools request
+_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "url": {
+            "type": "string",
+            "description": "URL to fetch and extract content from (http/https only)"
+        },
+        "html": {
+            "type": "string",
+            "description": "Raw HTML content to extract from"
+        },
+        "precision": {
+            "type": "boolean",
+            "description": "Favor precision over recall (default: true)",
+            "default": True
+        },
+        "include_comments": {
+            "type": "boolean",
+            "description": "Include HTML comments in extracted content (default: false)",
+            "default": False
+        },
+        "include_tables": {
+            "type": "boolean",
+            "description": "Include tables in extracted content (default: true)",
+            "default": True
+        },
+        "include_images": {
+            "type": "boolean",
+            "description": "Include images in extracted content (default: true)",
+            "default": True
+        },
+        "include_links": {
+            "type": "boolean",
+            "description": "Include links in extracted content (default: true)",
+            "default": True
+        },
+        "timeout": {
+            "type": "integer",
+            "description": "Request timeout in seconds for URL fetching (5-120, default: 30)",
+            "minimum": 5,
+            "maximum": 120,
+            "default": 30
+        },
+        "output_format": {
+            "type": "string",
+            "description": "Output format (default: 'markdown')",
+            "enum": ["markdown", "txt", "xml"],
+            "default": "markdown"
+        }
+    },
+    "oneOf": [
+        {"required": ["url"]},
+        {"required": ["html"]}
+    ],
+    "additionalProperties": False
+}
+
+_TOOL_DEF = Tool(
+    name="extract_markdown",
+    description=(
+        "Extract main article content from web pages or HTML and return as "
+        "markdown, plain text, or XML. Uses Trafilatura's advanced content "
+        "extraction algorithms to identify and clean the main textual content "
+        "while filtering out navigation, ads, and boilerplate."
+    ),
+    inputSchema=_INPUT_SCHEMA,
+)
+
+
 @server.list_tools()
 async def list_tools() -> List[Tool]:
     """List available tools."""
-    return [
-        Tool(
-            name="extract_markdown",
-            description=(
-                "Extract main article content from web pages or HTML and return as "
-                "markdown, plain text, or XML. Uses Trafilatura's advanced content "
-                "extraction algorithms to identify and clean the main textual content "
-                "while filtering out navigation, ads, and boilerplate."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "URL to fetch and extract content from (http/https only)"
-                    },
-                    "html": {
-                        "type": "string",
-                        "description": "Raw HTML content to extract from"
-                    },
-                    "precision": {
-                        "type": "boolean",
-                        "description": "Favor precision over recall (default: true)",
-                        "default": True
-                    },
-                    "include_comments": {
-                        "type": "boolean",
-                        "description": "Include HTML comments in extracted content (default: false)",
-                        "default": False
-                    },
-                    "include_tables": {
-                        "type": "boolean",
-                        "description": "Include tables in extracted content (default: true)",
-                        "default": True
-                    },
-                    "include_images": {
-                        "type": "boolean",
-                        "description": "Include images in extracted content (default: true)",
-                        "default": True
-                    },
-                    "include_links": {
-                        "type": "boolean",
-                        "description": "Include links in extracted content (default: true)",
-                        "default": True
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Request timeout in seconds for URL fetching (5-120, default: 30)",
-                        "minimum": 5,
-                        "maximum": 120,
-                        "default": 30
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "description": "Output format (default: 'markdown')",
-                        "enum": ["markdown", "txt", "xml"],
-                        "default": "markdown"
-                    }
-                },
-                "oneOf": [
-                    {"required": ["url"]},
-                    {"required": ["html"]}
-                ],
-                "additionalProperties": False
-            }
-        )
-    ]
+    return [_TOOL_DEF]
+
+
+def _error_result(message: str) -> CallToolResult:
+    """
+    Build an error CallToolResult without pydantic validation.
+
+    The fields are known-good by construction, so ``model_construct`` skips the
+    validation cost on error paths.
+    """
+    return CallToolResult.model_construct(
+        content=[TextContent.model_construct(type="text", text=message)],
+        isError=True,
+    )
 
 
 @server.call_tool()
@@ -349,28 +730,29 @@ async def call_tool(request: CallToolRequest) -> CallToolResult:
         content = await extract_markdown_tool(request.params.arguments or {})
         return CallToolResult(content=content, isError=False)
     except McpError as e:
-        logger.error(f"Tool call failed: {e}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=str(e))],
-            isError=True
-        )
+        logger.error("Tool call failed: %s", e)
+        return _error_result(str(e))
     except Exception as e:
-        logger.error(f"Unexpected error in tool call: {e}")
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Internal error: {e}")],
-            isError=True
-        )
+        logger.error("Unexpected error in tool call: %s", e)
+        return _error_result(f"Internal error: {e}")
 
 
 def main() -> None:
     """Main entry point for the MCP server."""
     logger.info("Starting Trafilatura MCP Server v0.1.0")
+    try:
+        import uvloop  # Optional: faster event loop (pip install "mcp-trafilatura-server[speed]")
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         server.run(stdio_transport())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         raise
 
 